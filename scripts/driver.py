@@ -133,14 +133,9 @@ class Tracer:
             self.printInColor("---\tTOTAL\t\t%d/%d" % (score, maxscore), self.GREEN)
         if self.autograde:
             # Generate JSON string
-            jstring = '{"scores": {'
-            first = True
-            for k in scoreDict.keys():
-                if not first:
-                    jstring += ', '
-                first = False
-                jstring += '"%s" : %d' % (self.traceProbs[k], scoreDict[k])
-            jstring += '}}'
+            parts = ['"%s" : %d' % (self.traceProbs[k], scoreDict[k])
+                     for k in scoreDict.keys()]
+            jstring = '{"scores": {' + ', '.join(parts) + '}}'
             print(jstring)
         if score < maxscore:
             sys.exit(1)